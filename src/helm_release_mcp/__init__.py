@@ -1,26 +1,61 @@
 """Helm Release MCP Server - Automate Helm chart releases across GitHub repositories."""
 
+import asyncio
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from helm_release_mcp.api import router
+from helm_release_mcp.api import BearerAuthMiddleware, router
 from helm_release_mcp.api.tool_calls import router as tool_calls_router
 from helm_release_mcp.server import create_server
 from helm_release_mcp.settings import get_settings
 
+try:
+    import uvloop
 
-def main() -> None:
+    HAS_UVLOOP = True
+except ImportError:  # uvloop is not available on Windows
+    HAS_UVLOOP = False
+
+
+def create_app() -> FastAPI:
+    """Build the HTTP application: the MCP endpoint plus the REST API.
+
+    Used as a Uvicorn app factory so each worker process builds its own app.
+    """
     settings = get_settings()
     server = create_server()
 
+    # MCP sessions live in process memory; with several workers a session's
+    # requests may land on different processes, so run the endpoint stateless.
+    mcp_app = server.http_app(path="/mcp", stateless_http=settings.workers > 1)
+    app = FastAPI(
+        lifespan=mcp_app.lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    app.add_middleware(BearerAuthMiddleware)
+    app.include_router(router)
+    app.include_router(tool_calls_router)
+    app.mount("/", mcp_app)
+    return app
+
+
+def main() -> None:
+    settings = get_settings()
+
     if settings.transport == "stdio":
+        server = create_server()
+        if HAS_UVLOOP:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         server.run(settings.transport)
     else:
-        mcp_app = server.http_app(path="/mcp")
-        app = FastAPI(
-            lifespan=mcp_app.lifespan,
+        uvicorn.run(
+            "helm_release_mcp:create_app",
+            factory=True,
+            workers=settings.workers,
+            host=settings.host,
+            port=settings.port,
+            loop="uvloop" if HAS_UVLOOP else "asyncio",
+            http="auto",  # httptools when installed, h11 otherwise
         )
-        app.include_router(router)
-        app.include_router(tool_calls_router)
-        app.mount("/", mcp_app)
-        uvicorn.run(app, host=settings.host, port=settings.port)
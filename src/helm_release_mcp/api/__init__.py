@@ -1,26 +1,65 @@
-from typing import Annotated
+import hmac
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter
 from pydantic import BaseModel
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from helm_release_mcp.settings import get_settings
 
 router = APIRouter()
 
+# Paths under /api/ that do not require the bearer token
+PUBLIC_API_PATHS = frozenset({"/api/health"})
+
 
 class HealthCheckResponse(BaseModel):
     status: str
 
 
-security = HTTPBearer()
+@lru_cache(maxsize=1)
+def _expected_token() -> bytes | None:
+    """Configured auth token, encoded once for constant-time comparison."""
+    auth_token = get_settings().auth_token
+    return auth_token.encode() if auth_token else None
+
+
+class BearerAuthMiddleware:
+    """Require the configured bearer token on every /api/ route.
+
+    Runs as plain ASGI so unauthorized requests are rejected before any
+    routing or dependency resolution happens.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and self._requires_auth(scope["path"])
+            and not self._is_authorized(scope)
+        ):
+            response = PlainTextResponse("Unauthorized", status_code=401)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
+    @staticmethod
+    def _requires_auth(path: str) -> bool:
+        return path.startswith("/api/") and path not in PUBLIC_API_PATHS
 
-async def verify_token(bearer: Annotated[HTTPAuthorizationCredentials, Depends(security)]):
-    token = bearer.credentials
-    if token != get_settings().auth_token:
-        raise HTTPException(status_code=401, detail="Unauthorized")
-    return token
+    @staticmethod
+    def _is_authorized(scope: Scope) -> bool:
+        expected = _expected_token()
+        if expected is None:
+            return False
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.partition(b" ")
+                return scheme.lower() == b"bearer" and hmac.compare_digest(token, expected)
+        return False
 
 
 @router.get("/api/health")
@@ -1,11 +1,7 @@
-from typing import Annotated
-
-from fastapi import Depends
 from fastapi.routing import APIRouter
 from pydantic import BaseModel
 
-from helm_release_mcp.api import verify_token
-
+# Authentication is enforced by BearerAuthMiddleware
 router = APIRouter()
 
 
@@ -20,7 +16,7 @@ class ToolCallResponse(BaseModel):
 
 
 @router.get("/api/tool-calls")
-async def api_tool_calls(_: Annotated[str, Depends(verify_token)]):
+async def api_tool_calls() -> ToolCallResponse:
     return ToolCallResponse(
         items=[
             ToolCallItem(
@@ -1,52 +1,97 @@
 """File operations service for YAML/JSON manipulation."""
 
+import copy
+import io
 import json
 import os
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
 from ruamel.yaml import YAML
 
+# Parsed files kept in memory; the least recently read is dropped first
+FILE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated path into its keys (memoized)."""
+    return tuple(path.split("."))
+
+
+def _roundtrip_yaml() -> YAML:
+    rt = YAML()
+    rt.preserve_quotes = True
+    rt.indent(mapping=2, sequence=4, offset=2)
+    return rt
+
+
+def _safe_yaml() -> YAML:
+    # Same YAML 1.2 rules as the round-trip loader; ruamel.yaml.clib's C
+    # parser is used when installed, pure Python otherwise
+    return YAML(typ="safe", pure=False)
+
 
 class FileService:
     """Service for file operations with YAML/JSON support.
 
-    Uses ruamel.yaml to preserve formatting, comments, and order in YAML files.
+    Uses ruamel.yaml to preserve formatting, comments, and order in YAML files
+    that are written back to disk. Read-only loads use ruamel's safe loader.
     """
 
     _env_pattern = re.compile(r"\$\{([^}]+)\}")
+    _yaml = _roundtrip_yaml()
+    _safe = _safe_yaml()
 
     def __init__(self) -> None:
-        self._yaml = YAML()
-        self._yaml.preserve_quotes = True
-        self._yaml.indent(mapping=2, sequence=4, offset=2)
+        # (path, format) -> (st_mtime_ns, st_size, parsed data), in LRU order
+        self._cache: OrderedDict[tuple[Path, str], tuple[int, int, dict[str, Any]]] = OrderedDict()
+        # Directories already created/seen, to skip mkdir on repeat writes
+        self._known_dirs: set[Path] = set()
 
-    def read_yaml(self, path: Path) -> dict[str, Any]:
+    def read_yaml(self, path: Path, *, preserve: bool = False) -> dict[str, Any]:
         """Read a YAML file and return its contents.
 
         Args:
             path: Path to the YAML file.
+            preserve: Use the round-trip loader and return its tree, so
+                comments, quoting and key order survive write_yaml.
+                Otherwise use the faster safe loader and return plain dicts.
 
         Returns:
-            Parsed YAML contents as a dictionary.
+            Parsed YAML contents as a dictionary (a ruamel CommentedMap
+            when preserve is set).
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
             ValueError: If the file cannot be parsed.
         """
-        if not path.exists():
-            raise FileNotFoundError(f"YAML file not found: {path}")
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"YAML file not found: {path}") from None
+
+        cache_key = (path, "yaml-rt" if preserve else "yaml")
+        cached = self._cache_get(cache_key, stat)
+        if cached is not None:
+            return cached
 
         try:
             with path.open("r") as f:
-                data = self._yaml.load(f)
-                normalized = dict(data) if data else {}
-                expanded = self._expand_env_vars(normalized)
-                return expanded if isinstance(expanded, dict) else {}
+                data = (self._yaml if preserve else self._safe).load(f)
+                # Freshly loaded, so expanding in place touches no shared state
+                expanded = self._expand_env_vars(data or {})
+                result = expanded if isinstance(expanded, dict) else {}
         except Exception as e:
             raise ValueError(f"Failed to parse YAML file {path}: {e}") from e
 
+        self._cache_put(cache_key, stat, result)
+        return result
+
     def write_yaml(self, path: Path, data: dict[str, Any]) -> None:
         """Write data to a YAML file, preserving formatting.
 
@@ -54,9 +99,9 @@ class FileService:
             path: Path to the YAML file.
             data: Data to write.
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w") as f:
-            self._yaml.dump(data, f)
+        buf = io.BytesIO()
+        self._yaml.dump(data, buf)
+        self._write_bytes(path, buf.getvalue())
 
     def update_yaml(
         self,
@@ -75,7 +120,7 @@ class FileService:
         Returns:
             The updated data.
         """
-        data = self.read_yaml(path)
+        data = self.read_yaml(path, preserve=True)
 
         if merge_deep:
             self._deep_merge(data, updates)
@@ -94,12 +139,20 @@ class FileService:
         Returns:
             Parsed JSON contents as a dictionary.
         """
-        if not path.exists():
-            raise FileNotFoundError(f"JSON file not found: {path}")
-
-        with path.open("r") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {path}") from None
+
+        cache_key = (path, "json")
+        cached = self._cache_get(cache_key, stat)
+        if cached is not None:
+            return cached
+
+        data = orjson.loads(path.read_bytes())
+        result = data if isinstance(data, dict) else {}
+        self._cache_put(cache_key, stat, result)
+        return result
 
     def write_json(self, path: Path, data: dict[str, Any], *, indent: int = 2) -> None:
         """Write data to a JSON file.
@@ -108,11 +161,63 @@ class FileService:
             path: Path to the JSON file.
             data: Data to write.
             indent: Indentation level for pretty printing.
+
+        Raises:
+            ValueError: If the data cannot be serialized to JSON.
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w") as f:
-            json.dump(data, f, indent=indent)
-            f.write("\n")
+        try:
+            if indent == 2:
+                # Newline appended by orjson itself, saving a copy of the output.
+                # Non-string keys are stringified, as json.dumps does.
+                content = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_APPEND_NEWLINE
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            else:
+                # orjson only supports 2-space indentation; write UTF-8 unescaped like it does
+                content = (json.dumps(data, indent=indent, ensure_ascii=False) + "\n").encode()
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Failed to serialize JSON for {path}: {e}") from e
+        self._write_bytes(path, content)
+
+    def _write_bytes(self, path: Path, content: bytes) -> None:
+        """Write a file in one call, creating its directory on first use."""
+        self._invalidate(path)
+        parent = path.parent
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+        try:
+            path.write_bytes(content)
+        except FileNotFoundError:
+            # Directory was removed since we last saw it (e.g. workspace cleanup)
+            parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+    def clear_cache(self) -> None:
+        """Drop all cached file contents."""
+        self._cache.clear()
+
+    def _cache_get(self, key: tuple[Path, str], stat: os.stat_result) -> dict[str, Any] | None:
+        """Return a copy of the cached data if the file is unchanged on disk."""
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        self._cache.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def _cache_put(self, key: tuple[Path, str], stat: os.stat_result, data: dict[str, Any]) -> None:
+        # Callers may mutate the returned data, so keep a private copy
+        self._cache[key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(data))
+        self._cache.move_to_end(key)
+        while len(self._cache) > FILE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _invalidate(self, path: Path) -> None:
+        for fmt in ("yaml", "yaml-rt", "json"):
+            self._cache.pop((path, fmt), None)
 
     def get_nested_value(self, data: dict[str, Any], path: str) -> Any:
         """Get a value from a nested dictionary using dot notation.
@@ -127,12 +232,12 @@ class FileService:
         Raises:
             KeyError: If the path doesn't exist.
         """
-        keys = path.split(".")
-        result = data
-        for key in keys:
-            if not isinstance(result, dict):
-                raise KeyError(f"Cannot traverse non-dict at key: {key}")
-            result = result[key]
+        result: Any = data
+        try:
+            for key in _compile_path(path):
+                result = result[key]
+        except TypeError as e:
+            raise KeyError(f"Cannot traverse non-dict in path: {path}") from e
         return result
 
     def set_nested_value(self, data: dict[str, Any], path: str, value: Any) -> None:
@@ -143,29 +248,43 @@ class FileService:
             path: Dot-separated path (e.g., "metadata.version").
             value: The value to set.
         """
-        keys = path.split(".")
+        *parents, last = _compile_path(path)
         current = data
-        for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        current[keys[-1]] = value
+        for key in parents:
+            current = current.setdefault(key, {})
+        current[last] = value
 
     def _deep_merge(self, base: dict[str, Any], updates: dict[str, Any]) -> None:
-        """Recursively merge updates into base dictionary."""
-        for key, value in updates.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        """Deep merge updates into base dictionary, in place."""
+        # Explicit stack instead of recursion: one frame however deep the values go
+        stack = [(base, updates)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                existing = target.get(key)
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    stack.append((existing, value))
+                else:
+                    target[key] = value
 
     def _expand_env_vars(self, value: Any) -> Any:
+        """Expand ${VAR} references, updating containers in place.
+
+        Containers keep their type (and so a round-trip tree its comments
+        and layout); only strings that contain a reference are replaced.
+        """
         if isinstance(value, dict):
-            return {key: self._expand_env_vars(val) for key, val in value.items()}
+            for key, val in value.items():
+                value[key] = self._expand_env_vars(val)
+            return value
         if isinstance(value, list):
-            return [self._expand_env_vars(item) for item in value]
+            for i, item in enumerate(value):
+                value[i] = self._expand_env_vars(item)
+            return value
         if isinstance(value, str):
-            return self._env_pattern.sub(self._replace_env_var, value)
+            expanded = self._env_pattern.sub(self._replace_env_var, value)
+            # Keep ruamel's quoted scalar types when nothing was replaced
+            return value if expanded == value else expanded
         return value
 
     def _replace_env_var(self, match: re.Match[str]) -> str:
@@ -1,14 +1,21 @@
 """Git operations service using GitPython."""
 
 import logging
+import os
+import subprocess
+import tempfile
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
 
 from git import Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
 logger = logging.getLogger(__name__)
 
+# Above this many files, stage with a single `git add --pathspec-from-file`
+PATHSPEC_FILE_THRESHOLD = 4
+
 
 class GitError(Exception):
     """Exception raised for git operation failures."""
@@ -16,12 +23,54 @@ class GitError(Exception):
     pass
 
 
+@dataclass
+class _RepoState:
+    """Cached HEAD information for a repository."""
+
+    branch: str | None = None
+    head_sha: str | None = None
+
+
 class GitService:
     """Service for local git operations.
 
     Wraps GitPython to provide a clean interface for common git operations.
     """
 
+    # Full clones are made as blobless partial clones (blobs fetched on demand)
+    enable_partial_clone: bool = True
+
+    def __init__(self) -> None:
+        # Each lookup forks git, so cache until an operation moves HEAD. Keyed
+        # by id(): Repo equality is by git_dir, and a reopened or re-cloned
+        # Repo must not inherit an older object's entry.
+        self._states: dict[int, _RepoState] = {}
+
+    def _state(self, repo: Repo) -> _RepoState:
+        key = id(repo)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _RepoState()
+            # Drop the entry with the Repo, before its id can be reused
+            weakref.finalize(repo, self._states.pop, key, None)
+        return state
+
+    def _invalidate(self, repo: Repo) -> None:
+        state = self._states.get(id(repo))
+        if state is not None:
+            state.branch = state.head_sha = None
+
+    def forget(self, repo: Repo) -> None:
+        """Drop cached HEAD information for a repository.
+
+        Call when a Repo is closed or its working tree is replaced outside
+        this service (e.g. removed and cloned again).
+
+        Args:
+            repo: Repository object.
+        """
+        self._states.pop(id(repo), None)
+
     def clone(
         self,
         url: str,
@@ -29,6 +78,7 @@ class GitService:
         *,
         depth: int | None = None,
         branch: str | None = None,
+        env: dict[str, str] | None = None,
     ) -> Repo:
         """Clone a repository.
 
@@ -37,6 +87,7 @@ class GitService:
             target_dir: Local directory to clone into.
             depth: Shallow clone depth (None for full clone).
             branch: Specific branch to clone.
+            env: Extra environment variables for the git process.
 
         Returns:
             The cloned repository object.
@@ -44,18 +95,27 @@ class GitService:
         Raises:
             GitError: If clone fails.
         """
+        cmd = ["git", "clone"]
+        if depth is not None:
+            cmd += ["--depth", str(depth)]
+        elif self.enable_partial_clone:
+            cmd.append("--filter=blob:none")
+        if branch is not None:
+            cmd += ["--branch", branch]
+        cmd += [url, str(target_dir)]
+
+        logger.info(f"Cloning {url} to {target_dir}")
         try:
-            kwargs: dict[str, Any] = {}
-            if depth is not None:
-                kwargs["depth"] = depth
-            if branch is not None:
-                kwargs["branch"] = branch
-
-            logger.info(f"Cloning {url} to {target_dir}")
-            repo = Repo.clone_from(url, target_dir, **kwargs)
-            return repo
-        except GitCommandError as e:
-            raise GitError(f"Failed to clone {url}: {e}") from e
+            subprocess.run(
+                cmd,
+                check=True,
+                capture_output=True,
+                text=True,
+                env={**os.environ, **env} if env else None,
+            )
+        except subprocess.CalledProcessError as e:
+            raise GitError(f"Failed to clone {url}: {e.stderr.strip()}") from e
+        return Repo(target_dir)
 
     def open(self, path: Path) -> Repo:
         """Open an existing repository.
@@ -85,6 +145,7 @@ class GitService:
         Raises:
             GitError: If pull fails.
         """
+        self._invalidate(repo)
         try:
             remote_obj = repo.remote(remote)
             if branch:
@@ -102,6 +163,7 @@ class GitService:
             repo: Repository object.
             remote: Remote name.
         """
+        self._invalidate(repo)
         try:
             repo.remote(remote).fetch()
         except GitCommandError as e:
@@ -126,6 +188,7 @@ class GitService:
         Raises:
             GitError: If checkout fails.
         """
+        self._invalidate(repo)
         try:
             if create:
                 if start_point:
@@ -185,16 +248,28 @@ class GitService:
         """
         try:
             if files:
-                repo.index.add(files)
+                self._stage(repo, files)
             elif all_changes:
                 repo.git.add("-A")
 
+            self._invalidate(repo)
             commit = repo.index.commit(message)
             logger.info(f"Created commit: {commit.hexsha[:8]} - {message}")
             return commit.hexsha
         except GitCommandError as e:
             raise GitError(f"Failed to commit: {e}") from e
 
+    def _stage(self, repo: Repo, files: list[str]) -> None:
+        """Stage files, batching large lists into one git invocation."""
+        if len(files) <= PATHSPEC_FILE_THRESHOLD:
+            repo.index.add(files)
+            return
+
+        with tempfile.NamedTemporaryFile("wb", suffix=".pathspec") as pathspec:
+            pathspec.write(b"\0".join(str(f).encode() for f in files))
+            pathspec.flush()
+            repo.git.add(f"--pathspec-from-file={pathspec.name}", "--pathspec-file-nul")
+
     def push(
         self,
         repo: Repo,
@@ -216,6 +291,8 @@ class GitService:
         """
         try:
             remote_obj = repo.remote(remote)
+            # Read HEAD directly: the cached branch is for reporting only and
+            # must never decide what gets pushed
             target_branch = branch or repo.active_branch.name
 
             if set_upstream:
@@ -236,7 +313,10 @@ class GitService:
         Returns:
             Current branch name.
         """
-        return repo.active_branch.name
+        state = self._state(repo)
+        if state.branch is None:
+            state.branch = repo.active_branch.name
+        return state.branch
 
     def get_remote_url(self, repo: Repo, remote: str = "origin") -> str:
         """Get the URL of a remote.
@@ -270,4 +350,7 @@ class GitService:
         Returns:
             HEAD commit SHA.
         """
-        return repo.head.commit.hexsha
+        state = self._state(repo)
+        if state.head_sha is None:
+            state.head_sha = repo.head.commit.hexsha
+        return state.head_sha
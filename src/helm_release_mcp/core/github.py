@@ -1,17 +1,126 @@
 """GitHub API service using PyGithub."""
 
+import asyncio
+import functools
+import json
 import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import Any
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
 
 from github import Auth, Github, GithubException
+from github.GitRelease import GitRelease as GHGitRelease
 from github.PullRequest import PullRequest as GHPullRequest
 from github.Repository import Repository as GHRepo
-from github.WorkflowRun import WorkflowRun as GHWorkflowRun
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# GitHub timestamps are ISO 8601 ("2024-01-01T00:00:00Z")
+_iso = datetime.fromisoformat
+
+# One round-trip per 100 open PRs, with every field _pr_to_info needs
+_OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!, $base: String, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      states: OPEN
+      baseRefName: $base
+      first: 100
+      after: $cursor
+      orderBy: {field: CREATED_AT, direction: DESC}
+    ) {
+      nodes {
+        number title state url headRefOid headRefName baseRefName
+        mergeable merged isDraft createdAt updatedAt
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# Worker threads and keep-alive connections per host. PyGithub throttles
+# requests (0.25s apart, writes 1s apart), so more workers would just
+# wait on the throttle; this matches the registry's STATUS_CONCURRENCY.
+HTTP_POOL_SIZE = 10
+
+# How long a fetched Repository object is reused before re-fetching it
+REPO_CACHE_TTL_SECONDS = 300.0
+
+# Commit statuses and check runs of a PR's head commit in one request.
+# If either page is incomplete, the check runs are re-listed over REST.
+_PR_CHECKS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      commits(last: 1) {
+        nodes {
+          commit {
+            oid
+            status { state contexts { context state description } }
+            checkSuites(first: 50) {
+              pageInfo { hasNextPage }
+              nodes {
+                checkRuns(first: 100) {
+                  pageInfo { hasNextPage }
+                  nodes { name status conclusion }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# List/latest reads (releases, open PRs, workflow runs) kept in memory when
+# the service is given a read_cache_ttl; writes through the service drop the
+# repo's entries early
+READ_CACHE_SIZE = 256
+
+# Number of REST responses (runs, latest releases, list pages) kept with
+# their ETag for conditional requests
+ETAG_CACHE_SIZE = 256
+
+# Backoff while waiting for a dispatched workflow run to show up
+DISPATCH_POLL_INITIAL_DELAY = 0.25
+DISPATCH_POLL_MAX_DELAY = 4.0
+DISPATCH_CLOCK_SKEW = timedelta(seconds=5)
+
+# Branch head and tag existence in one request
+_BRANCH_AND_TAG_QUERY = """
+query($owner: String!, $name: String!, $branch: String!, $tag: String!) {
+  repository(owner: $owner, name: $name) {
+    branch: ref(qualifiedName: $branch) { target { oid } }
+    tag: ref(qualifiedName: $tag) { name }
+  }
+}
+"""
+
+# GraphQL MergeableState -> REST `mergeable`
+_MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False}
+
+# GraphQL StatusState -> REST commit status state. EXPECTED (a required
+# context that has not reported yet) has no REST equivalent; REST shows pending.
+_STATUS_STATE = {"EXPECTED": "pending"}
+
+# The REST combined state is only success, pending or failure; an errored
+# rollup counts as failure there
+_COMBINED_STATE = {**_STATUS_STATE, "ERROR": "failure"}
+
+
+def _status_state(state: str, mapping: dict[str, str] = _STATUS_STATE) -> str:
+    """Map a GraphQL StatusState to the REST commit status state."""
+    return mapping.get(state, state.lower())
+
 
 class GitHubError(Exception):
     """Exception raised for GitHub API failures."""
@@ -19,7 +128,7 @@ class GitHubError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PullRequestInfo:
     """Information about a pull request."""
 
@@ -41,7 +150,7 @@ class PullRequestInfo:
     review_state: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowRunInfo:
     """Information about a workflow run."""
 
@@ -59,7 +168,7 @@ class WorkflowRunInfo:
     run_started_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReleaseInfo:
     """Information about a GitHub release."""
 
@@ -74,7 +183,7 @@ class ReleaseInfo:
     published_at: datetime | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BranchInfo:
     """Information about a branch and its latest commit."""
 
@@ -89,7 +198,7 @@ class BranchInfo:
     commit_url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommitComparison:
     """Comparison result between two commits."""
 
@@ -106,22 +215,73 @@ class GitHubService:
     Provides methods for working with pull requests, workflows, and releases.
     """
 
-    def __init__(self, token: str, base_url: str = "https://api.github.com") -> None:
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://api.github.com",
+        executor: ThreadPoolExecutor | None = None,
+        read_cache_ttl: float = 0,
+    ) -> None:
         """Initialize the GitHub service.
 
         Args:
             token: GitHub personal access token.
             base_url: GitHub API base URL (for GitHub Enterprise).
+            executor: Thread pool for run_in_pool. If omitted, the service
+                creates and owns one.
+            read_cache_ttl: Seconds list_open_prs, list_workflow_runs and
+                get_latest_release results are reused (0 disables).
         """
+        self._base_url = base_url.rstrip("/")
         auth = Auth.Token(token)
+        # Largest page GitHub serves: fewer round-trips when paginating
+        options: dict[str, Any] = {"per_page": 100, "pool_size": HTTP_POOL_SIZE}
         if base_url == "https://api.github.com":
-            self._client = Github(auth=auth)
+            self._client = Github(auth=auth, **options)
         else:
-            self._client = Github(auth=auth, base_url=base_url)
+            self._client = Github(auth=auth, base_url=base_url, **options)
+        self._repos: dict[str, tuple[float, GHRepo]] = {}
+        self._default_branches: dict[str, str] = {}
+        # Request (URL, parameters) -> (ETag, last JSON body); see _get_json
+        self._etags: dict[tuple[str, tuple[Any, ...]], tuple[str, Any]] = {}
+        self._etags_lock = threading.Lock()
+        # (repo_path, method, *args) -> (fetched at, result); see _cached_read
+        self._read_cache_ttl = read_cache_ttl
+        self._reads: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._reads_lock = threading.Lock()
+        # PyGithub is blocking; async callers run its calls here (run_in_pool)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=HTTP_POOL_SIZE, thread_name_prefix="github"
+        )
+
+    def with_token(self, token: str) -> "GitHubService":
+        """Create a service for another token that shares this one's thread pool.
+
+        Args:
+            token: GitHub personal access token.
+
+        Returns:
+            A new GitHubService. Closing it leaves the shared pool running.
+        """
+        return GitHubService(
+            token,
+            self._base_url,
+            executor=self._executor,
+            read_cache_ttl=self._read_cache_ttl,
+        )
+
+    async def run_in_pool(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking GitHub call on the service's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
 
     def get_repo(self, repo_path: str) -> GHRepo:
         """Get a repository object.
 
+        Fetched objects are reused for REPO_CACHE_TTL_SECONDS, so back-to-back
+        operations on one repository share a single `GET /repos/{owner}/{repo}`.
+
         Args:
             repo_path: Repository path in "owner/repo" format.
 
@@ -131,10 +291,47 @@ class GitHubService:
         Raises:
             GitHubError: If repository not found.
         """
+        cached = self._repos.get(repo_path)
+        if cached is not None and time.monotonic() - cached[0] < REPO_CACHE_TTL_SECONDS:
+            return cached[1]
         try:
-            return self._client.get_repo(repo_path)
+            repo = self._client.get_repo(repo_path)
         except GithubException as e:
             raise GitHubError(f"Repository not found: {repo_path}: {e}") from e
+        self._repos[repo_path] = (time.monotonic(), repo)
+        return repo
+
+    def _cached_read(self, key: tuple[Any, ...], fetch: Callable[[], T]) -> T:
+        """Return a recent result for key, calling fetch on a miss.
+
+        Keys start with the repository path so invalidate() can find them.
+        Every call fetches when the read cache TTL is 0.
+        """
+        if self._read_cache_ttl <= 0:
+            return fetch()
+        with self._reads_lock:
+            cached = self._reads.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._read_cache_ttl:
+            result: T = cached[1]
+            return result
+
+        result = fetch()
+        with self._reads_lock:
+            if key not in self._reads and len(self._reads) >= READ_CACHE_SIZE:
+                # Drop the oldest entry; dicts keep insertion order
+                self._reads.pop(next(iter(self._reads)))
+            self._reads[key] = (time.monotonic(), result)
+        return result
+
+    def invalidate(self, repo_path: str) -> None:
+        """Drop cached reads for a repository.
+
+        Args:
+            repo_path: Repository path in "owner/repo" format.
+        """
+        with self._reads_lock:
+            for key in [k for k in self._reads if k[0] == repo_path]:
+                del self._reads[key]
 
     # =========================================================================
     # Pull Request Operations
@@ -176,6 +373,7 @@ class GitHubService:
                 draft=draft,
             )
             logger.info(f"Created PR #{pr.number}: {title}")
+            self.invalidate(repo_path)
             return self._pr_to_info(pr)
         except GithubException as e:
             raise GitHubError(f"Failed to create PR: {e}") from e
@@ -191,9 +389,11 @@ class GitHubService:
             Pull request information.
         """
         try:
-            repo = self.get_repo(repo_path)
-            pr = repo.get_pull(pr_number)
-            return self._pr_to_info(pr)
+            # Raw JSON: one request, no lazy attribute completion
+            _, data = self._client.requester.requestJsonAndCheck(
+                "GET", f"/repos/{repo_path}/pulls/{pr_number}"
+            )
+            return self._pr_data_to_info(data)
         except GithubException as e:
             raise GitHubError(f"Failed to get PR #{pr_number}: {e}") from e
 
@@ -232,6 +432,7 @@ class GitHubService:
                 kwargs["commit_message"] = commit_message
 
             result = pr.merge(**kwargs)
+            self.invalidate(repo_path)
             if result.merged:
                 logger.info(f"Merged PR #{pr_number}")
                 return True
@@ -249,36 +450,51 @@ class GitHubService:
         Returns:
             Dictionary with check information.
         """
+        owner, name = repo_path.split("/", 1)
         try:
-            repo = self.get_repo(repo_path)
-            pr = repo.get_pull(pr_number)
-
-            # Get combined status
-            commit = repo.get_commit(pr.head.sha)
-            combined_status = commit.get_combined_status()
-
-            # Get check runs
-            check_runs = list(commit.get_check_runs())
-
-            return {
-                "state": combined_status.state,
-                "total_count": combined_status.total_count,
-                "statuses": [
-                    {"context": s.context, "state": s.state, "description": s.description}
-                    for s in combined_status.statuses
-                ],
-                "check_runs": [
+            data = self._graphql(
+                _PR_CHECKS_QUERY, {"owner": owner, "name": name, "number": pr_number}
+            )
+            head = data["repository"]["pullRequest"]["commits"]["nodes"][0]["commit"]
+            suites = head["checkSuites"]
+            if suites["pageInfo"]["hasNextPage"] or any(
+                suite["checkRuns"]["pageInfo"]["hasNextPage"] for suite in suites["nodes"]
+            ):
+                # More runs than one query returns; REST paginates through all of them
+                commit = self.get_repo(repo_path).get_commit(head["oid"])
+                check_runs: list[dict[str, Any]] = [
+                    {"name": cr.name, "status": cr.status, "conclusion": cr.conclusion}
+                    for cr in commit.get_check_runs()
+                ]
+            else:
+                check_runs = [
                     {
-                        "name": cr.name,
-                        "status": cr.status,
-                        "conclusion": cr.conclusion,
+                        "name": cr["name"],
+                        "status": cr["status"].lower(),
+                        "conclusion": cr["conclusion"].lower() if cr["conclusion"] else None,
                     }
-                    for cr in check_runs
-                ],
-            }
+                    for suite in suites["nodes"]
+                    for cr in suite["checkRuns"]["nodes"]
+                ]
         except GithubException as e:
             raise GitHubError(f"Failed to get PR checks: {e}") from e
 
+        # Same shape as the REST combined status: no statuses reads as pending
+        status = head["status"] or {"state": "PENDING", "contexts": []}
+        return {
+            "state": _status_state(status["state"], _COMBINED_STATE),
+            "total_count": len(status["contexts"]),
+            "statuses": [
+                {
+                    "context": c["context"],
+                    "state": _status_state(c["state"]),
+                    "description": c["description"],
+                }
+                for c in status["contexts"]
+            ],
+            "check_runs": check_runs,
+        }
+
     def get_pr_reviews(self, repo_path: str, pr_number: int) -> list[dict[str, Any]]:
         """Get reviews on a pull request.
 
@@ -308,6 +524,8 @@ class GitHubService:
     def list_open_prs(self, repo_path: str, *, base: str | None = None) -> list[PullRequestInfo]:
         """List open pull requests.
 
+        Results are reused for the service's read cache TTL (off by default).
+
         Args:
             repo_path: Repository path.
             base: Filter by base branch.
@@ -315,30 +533,131 @@ class GitHubService:
         Returns:
             List of open pull requests.
         """
+        prs = self._cached_read(
+            (repo_path, "open_prs", base), lambda: self._fetch_open_prs(repo_path, base)
+        )
+        return list(prs)
+
+    def _fetch_open_prs(self, repo_path: str, base: str | None) -> list[PullRequestInfo]:
+        owner, name = repo_path.split("/", 1)
+        variables: dict[str, Any] = {"owner": owner, "name": name, "base": base, "cursor": None}
+        prs: list[PullRequestInfo] = []
         try:
-            repo = self.get_repo(repo_path)
-            prs = repo.get_pulls(state="open", base=base) if base else repo.get_pulls(state="open")
-            return [self._pr_to_info(pr) for pr in prs]
+            while True:
+                data = self._graphql(_OPEN_PRS_QUERY, variables)
+                connection = data["repository"]["pullRequests"]
+                prs.extend(self._pr_node_to_info(repo_path, node) for node in connection["nodes"])
+                if not connection["pageInfo"]["hasNextPage"]:
+                    return prs
+                variables["cursor"] = connection["pageInfo"]["endCursor"]
         except GithubException as e:
             raise GitHubError(f"Failed to list PRs: {e}") from e
 
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a GraphQL query and return its `data` payload."""
+        _, response = self._client.requester.graphql_query(query, variables)
+        data: dict[str, Any] = response["data"]
+        return data
+
+    def _iter_raw(
+        self,
+        url: str,
+        parameters: dict[str, Any],
+        *,
+        limit: int,
+        list_item: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield up to `limit` raw items from a paginated REST listing.
+
+        Works on the JSON directly: PyGithub list items are incomplete
+        objects, and reading their raw_data would re-fetch each one.
+        """
+        per_page = min(limit, 100)
+        page = 1
+        remaining = limit
+        while remaining > 0:
+            data = self._get_json(url, {**parameters, "per_page": per_page, "page": page})
+            items = data[list_item] if list_item else data
+            yield from items[:remaining]
+            remaining -= len(items)
+            if len(items) < per_page:
+                return
+            page += 1
+
+    def _get_json(self, url: str, parameters: dict[str, Any] | None = None) -> Any:
+        """GET a REST resource, revalidating the last response with its ETag.
+
+        An unchanged resource comes back as a 304 with no body, which does
+        not count against the rate limit; the previous body is returned.
+
+        Raises:
+            GithubException: If the request fails.
+        """
+        key = (url, tuple(sorted(parameters.items())) if parameters else ())
+        with self._etags_lock:
+            cached = self._etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        requester = self._client.requester
+        status, response_headers, body = requester.requestJson(
+            "GET", url, parameters, headers=headers
+        )
+        if status == 304 and cached:
+            return cached[1]
+        data = json.loads(body) if body else None
+        if status >= 400:
+            raise requester.createException(status, response_headers, data or {})
+
+        etag = response_headers.get("etag")
+        if etag:
+            with self._etags_lock:
+                if key not in self._etags and len(self._etags) >= ETAG_CACHE_SIZE:
+                    # Drop the oldest entry; dicts keep insertion order
+                    self._etags.pop(next(iter(self._etags)))
+                self._etags[key] = (etag, data)
+        return data
+
+    def _pr_node_to_info(self, repo_path: str, node: dict[str, Any]) -> PullRequestInfo:
+        """Convert a GraphQL PullRequest node to PullRequestInfo."""
+        return PullRequestInfo(
+            number=node["number"],
+            title=node["title"],
+            state=node["state"].lower(),
+            url=f"{self._base_url}/repos/{repo_path}/pulls/{node['number']}",
+            html_url=node["url"],
+            head_sha=node["headRefOid"],
+            head_ref=node["headRefName"],
+            base_ref=node["baseRefName"],
+            mergeable=_MERGEABLE.get(node["mergeable"]),
+            merged=node["merged"],
+            draft=node["isDraft"],
+            created_at=_iso(node["createdAt"]),
+            updated_at=_iso(node["updatedAt"]),
+        )
+
     def _pr_to_info(self, pr: GHPullRequest) -> PullRequestInfo:
         """Convert GitHub PR object to PullRequestInfo."""
+        return self._pr_data_to_info(pr.raw_data)
+
+    def _pr_data_to_info(self, data: dict[str, Any]) -> PullRequestInfo:
+        """Convert a REST pull request payload to PullRequestInfo."""
+        created_at = _iso(data["created_at"])
+        updated_at = data.get("updated_at")
         return PullRequestInfo(
-            number=pr.number,
-            title=pr.title,
-            state=pr.state,
-            url=pr.url,
-            html_url=pr.html_url,
-            head_sha=pr.head.sha,
-            head_ref=pr.head.ref,
-            base_ref=pr.base.ref,
-            mergeable=pr.mergeable,
-            merged=pr.merged,
-            draft=pr.draft,
-            created_at=pr.created_at or datetime.now(UTC),
-            updated_at=pr.updated_at or pr.created_at or datetime.now(UTC),
-            merge_commit_sha=pr.merge_commit_sha if pr.merged else None,
+            number=data["number"],
+            title=data["title"],
+            state=data["state"],
+            url=data["url"],
+            html_url=data["html_url"],
+            head_sha=data["head"]["sha"],
+            head_ref=data["head"]["ref"],
+            base_ref=data["base"]["ref"],
+            mergeable=data.get("mergeable"),
+            merged=data.get("merged", False),
+            draft=data.get("draft", False),
+            created_at=created_at,
+            updated_at=_iso(updated_at) if updated_at else created_at,
+            merge_commit_sha=data.get("merge_commit_sha") if data.get("merged") else None,
         )
 
     # =========================================================================
@@ -373,21 +692,29 @@ class GitHubService:
             repo = self.get_repo(repo_path)
             workflow = repo.get_workflow(workflow_file)
 
+            # Only runs created from now on can be ours; allow a little clock skew
+            created = (
+                f">={(datetime.now(UTC) - DISPATCH_CLOCK_SKEW).strftime('%Y-%m-%dT%H:%M:%SZ')}"
+            )
+
             success = workflow.create_dispatch(ref=ref, inputs=inputs or {})
             if not success:
                 raise GitHubError(f"Failed to trigger workflow: {workflow_file}")
 
             logger.info(f"Triggered workflow: {workflow_file} on {ref}")
+            self.invalidate(repo_path)
 
             # Try to get the run ID (may take a moment to appear)
-            import time
-
             deadline = time.monotonic() + wait_for_run_seconds
-            while time.monotonic() < deadline:
-                runs = list(workflow.get_runs(branch=ref, event="workflow_dispatch"))
-                if runs:
-                    return runs[0].id
-                time.sleep(2)
+            delay = DISPATCH_POLL_INITIAL_DELAY
+            while (remaining := deadline - time.monotonic()) > 0:
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, DISPATCH_POLL_MAX_DELAY)
+                # Newest run first; only the first page is needed
+                runs = workflow.get_runs(branch=ref, event="workflow_dispatch", created=created)
+                run = next(iter(runs), None)
+                if run is not None:
+                    return run.id
 
             raise GitHubError(f"Workflow run ID not available yet for {workflow_file} on {ref}")
 
@@ -397,6 +724,9 @@ class GitHubService:
     def get_workflow_run(self, repo_path: str, run_id: int) -> WorkflowRunInfo:
         """Get workflow run information.
 
+        Requests are conditional (see _get_json), so repeated polling of an
+        unchanged run does not count against the rate limit.
+
         Args:
             repo_path: Repository path.
             run_id: Workflow run ID.
@@ -405,11 +735,10 @@ class GitHubService:
             Workflow run information.
         """
         try:
-            repo = self.get_repo(repo_path)
-            run = repo.get_workflow_run(run_id)
-            return self._run_to_info(run)
+            data = self._get_json(f"/repos/{repo_path}/actions/runs/{run_id}")
         except GithubException as e:
             raise GitHubError(f"Failed to get workflow run {run_id}: {e}") from e
+        return self._run_data_to_info(data)
 
     def list_workflow_runs(
         self,
@@ -419,57 +748,77 @@ class GitHubService:
         branch: str | None = None,
         status: str | None = None,
         head_sha: str | None = None,
+        event: str | None = None,
+        created: str | None = None,
         limit: int = 10,
     ) -> list[WorkflowRunInfo]:
         """List workflow runs.
 
+        All filters are applied server-side. Results are reused for the
+        service's read cache TTL (off by default).
+
         Args:
             repo_path: Repository path.
             workflow_file: Filter by workflow file.
             branch: Filter by branch.
             status: Filter by status.
             head_sha: Filter by head commit SHA.
+            event: Filter by triggering event (e.g., "push", "workflow_dispatch").
+            created: Filter by creation date, in GitHub search syntax (e.g., ">=2024-01-01").
             limit: Maximum number of runs to return.
 
         Returns:
             List of workflow runs.
         """
-        try:
-            repo = self.get_repo(repo_path)
+        parameters: dict[str, Any] = {}
+        if branch:
+            parameters["branch"] = branch
+        if status:
+            parameters["status"] = status
+        if head_sha:
+            parameters["head_sha"] = head_sha
+        if event:
+            parameters["event"] = event
+        if created:
+            parameters["created"] = created
+
+        if workflow_file:
+            url = f"/repos/{repo_path}/actions/workflows/{workflow_file}/runs"
+        else:
+            url = f"/repos/{repo_path}/actions/runs"
 
-            kwargs: dict[str, Any] = {}
-            if branch:
-                kwargs["branch"] = branch
-            if status:
-                kwargs["status"] = status
-            if head_sha:
-                kwargs["head_sha"] = head_sha
-
-            if workflow_file:
-                workflow = repo.get_workflow(workflow_file)
-                runs = workflow.get_runs(**kwargs)
-            else:
-                runs = repo.get_workflow_runs(**kwargs)
+        key = (repo_path, "workflow_runs", url, tuple(sorted(parameters.items())), limit)
+        return list(
+            self._cached_read(key, lambda: self._fetch_workflow_runs(url, parameters, limit))
+        )
 
-            return [self._run_to_info(run) for run in list(runs)[:limit]]
+    def _fetch_workflow_runs(
+        self, url: str, parameters: dict[str, Any], limit: int
+    ) -> list[WorkflowRunInfo]:
+        try:
+            runs = self._iter_raw(url, parameters, limit=limit, list_item="workflow_runs")
+            return [self._run_data_to_info(run) for run in runs]
         except GithubException as e:
             raise GitHubError(f"Failed to list workflow runs: {e}") from e
 
-    def _run_to_info(self, run: GHWorkflowRun) -> WorkflowRunInfo:
-        """Convert GitHub workflow run to WorkflowRunInfo."""
+    def _run_data_to_info(self, data: dict[str, Any]) -> WorkflowRunInfo:
+        """Convert a REST workflow run payload to WorkflowRunInfo."""
+        created_at = _iso(data["created_at"])
+        updated_at = data.get("updated_at")
+        run_started_at = data.get("run_started_at")
         return WorkflowRunInfo(
-            id=run.id,
-            name=run.name or "",
-            status=run.status,
-            conclusion=run.conclusion,
-            url=run.url,
-            html_url=run.html_url,
-            head_sha=run.head_sha,
-            head_branch=run.head_branch or "",
-            event=run.event,
-            created_at=run.created_at,
-            updated_at=run.updated_at or run.created_at or datetime.now(UTC),
-            run_started_at=run.run_started_at,
+            id=data["id"],
+            name=data.get("name") or "",
+            status=data["status"],
+            conclusion=data.get("conclusion"),
+            url=data["url"],
+            html_url=data["html_url"],
+            head_sha=data["head_sha"],
+            head_branch=data.get("head_branch") or "",
+            event=data["event"],
+            created_at=created_at,
+            updated_at=_iso(updated_at) if updated_at else created_at,
+            run_started_at=_iso(run_started_at) if run_started_at else None,
         )
 
     # =========================================================================
@@ -516,6 +865,7 @@ class GitHubService:
 
             release = repo.create_git_release(**kwargs)
             logger.info(f"Created release: {tag_name}")
+            self.invalidate(repo_path)
             return self._release_to_info(release)
         except GithubException as e:
             raise GitHubError(f"Failed to create release {tag_name}: {e}") from e
@@ -523,16 +873,22 @@ class GitHubService:
     def get_latest_release(self, repo_path: str) -> ReleaseInfo | None:
         """Get the latest release.
 
+        Results are reused for the service's read cache TTL (off by default).
+
         Args:
             repo_path: Repository path.
 
         Returns:
             Latest release info, or None if no releases.
         """
+        return self._cached_read(
+            (repo_path, "latest_release"), lambda: self._fetch_latest_release(repo_path)
+        )
+
+    def _fetch_latest_release(self, repo_path: str) -> ReleaseInfo | None:
         try:
-            repo = self.get_repo(repo_path)
-            release = repo.get_latest_release()
-            return self._release_to_info(release)
+            data = self._get_json(f"/repos/{repo_path}/releases/latest")
+            return self._release_data_to_info(data)
         except GithubException as e:
             if e.status == 404:
                 return None
@@ -549,24 +905,28 @@ class GitHubService:
             List of releases.
         """
         try:
-            repo = self.get_repo(repo_path)
-            releases = list(repo.get_releases())[:limit]
-            return [self._release_to_info(r) for r in releases]
+            releases = self._iter_raw(f"/repos/{repo_path}/releases", {}, limit=limit)
+            return [self._release_data_to_info(r) for r in releases]
         except GithubException as e:
             raise GitHubError(f"Failed to list releases: {e}") from e
 
-    def _release_to_info(self, release: Any) -> ReleaseInfo:
+    def _release_to_info(self, release: GHGitRelease) -> ReleaseInfo:
         """Convert GitHub release to ReleaseInfo."""
+        return self._release_data_to_info(release.raw_data)
+
+    def _release_data_to_info(self, data: dict[str, Any]) -> ReleaseInfo:
+        """Convert a REST release payload to ReleaseInfo."""
+        published_at = data.get("published_at")
         return ReleaseInfo(
-            id=release.id,
-            tag_name=release.tag_name,
-            name=release.title or release.tag_name,
-            body=release.body or "",
-            draft=release.draft,
-            prerelease=release.prerelease,
-            html_url=release.html_url,
-            created_at=release.created_at,
-            published_at=release.published_at,
+            id=data["id"],
+            tag_name=data["tag_name"],
+            name=data.get("name") or data["tag_name"],
+            body=data.get("body") or "",
+            draft=data["draft"],
+            prerelease=data["prerelease"],
+            html_url=data["html_url"],
+            created_at=_iso(data["created_at"]),
+            published_at=_iso(published_at) if published_at else None,
         )
 
     # =========================================================================
@@ -603,21 +963,56 @@ class GitHubService:
             # Create the reference
             repo.create_git_ref(ref=f"refs/tags/{tag_name}", sha=tag.sha)
             logger.info(f"Created tag: {tag_name}")
+            self.invalidate(repo_path)
             return tag.sha
         except GithubException as e:
             raise GitHubError(f"Failed to create tag {tag_name}: {e}") from e
 
+    def resolve_branch_and_tag(
+        self, repo_path: str, branch: str, tag: str
+    ) -> tuple[str | None, bool]:
+        """Look up a branch head and whether a tag exists, in one request.
+
+        Args:
+            repo_path: Repository path.
+            branch: Branch name.
+            tag: Tag name.
+
+        Returns:
+            Tuple of (branch head SHA or None if missing, tag exists).
+        """
+        owner, name = repo_path.split("/", 1)
+        variables = {
+            "owner": owner,
+            "name": name,
+            "branch": f"refs/heads/{branch}",
+            "tag": f"refs/tags/{tag}",
+        }
+        try:
+            data = self._graphql(_BRANCH_AND_TAG_QUERY, variables)
+        except GithubException as e:
+            raise GitHubError(f"Failed to look up {branch} and {tag}: {e}") from e
+
+        repository = data["repository"]
+        branch_ref = repository["branch"]
+        return (branch_ref["target"]["oid"] if branch_ref else None, repository["tag"] is not None)
+
     def get_default_branch(self, repo_path: str) -> str:
         """Get the default branch name.
 
+        The result is remembered for the lifetime of the service; default
+        branches are effectively never renamed while the server runs.
+
         Args:
             repo_path: Repository path.
 
         Returns:
             Default branch name.
         """
-        repo = self.get_repo(repo_path)
-        return repo.default_branch
+        branch = self._default_branches.get(repo_path)
+        if branch is None:
+            branch = self._default_branches[repo_path] = self.get_repo(repo_path).default_branch
+        return branch
 
     def get_branch(self, repo_path: str, branch_name: str) -> BranchInfo | None:
         """Get branch information including latest commit details."""
@@ -644,6 +1039,32 @@ class GitHubService:
                 return None
             raise GitHubError(f"Failed to get branch {branch_name}: {e}") from e
 
+    def resolve_commit_sha(self, repo_path: str, ref: str) -> str | None:
+        """Resolve a tag, branch, or SHA to the commit SHA it points to.
+
+        One request: the commits endpoint accepts any ref, peels annotated
+        tags, and with the `sha` media type returns just the SHA.
+
+        Args:
+            repo_path: Repository path.
+            ref: Tag, branch, or commit SHA.
+
+        Returns:
+            Commit SHA, or None if the ref does not exist.
+        """
+        requester = self._client.requester
+        status, headers, body = requester.requestJson(
+            "GET",
+            f"/repos/{repo_path}/commits/{ref}",
+            headers={"Accept": "application/vnd.github.sha"},
+        )
+        if status in (404, 422):
+            return None
+        if status >= 400:
+            e = requester.createException(status, headers, json.loads(body) if body else {})
+            raise GitHubError(f"Failed to resolve ref {ref}: {e}") from e
+        return body.strip()
+
     # =========================================================================
     # Commit Comparison Operations
     # =========================================================================
@@ -683,4 +1104,12 @@ class GitHubService:
 
     def close(self) -> None:
         """Close the GitHub client."""
+        self._repos.clear()
+        with self._etags_lock:
+            self._etags.clear()
+        self._default_branches.clear()
+        with self._reads_lock:
+            self._reads.clear()
         self._client.close()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
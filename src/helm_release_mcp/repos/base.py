@@ -77,6 +77,9 @@ class BaseRepo(ABC):
     # Registry of repo type classes
     _type_registry: dict[str, type["BaseRepo"]] = {}
 
+    # Introspected operations per repo class; identical for every instance
+    _operations_cache: dict[type["BaseRepo"], dict[str, OperationInfo]] = {}
+
     def __init__(self, config: RepoConfig, services: CoreServices) -> None:
         """Initialize the repository.
 
@@ -86,13 +89,10 @@ class BaseRepo(ABC):
         """
         self.config = config
         self.services = services
-        self._operations: dict[str, OperationInfo] | None = None
 
         repo_token = self._get_setting("github_token")
         if repo_token and repo_token != services.default_github_token:
-            self._github_service: GitHubService | None = GitHubService(
-                repo_token, services.github_api_base_url
-            )
+            self._github_service: GitHubService | None = services.github.with_token(repo_token)
             self._github_token: str | None = repo_token
         else:
             self._github_service = None
@@ -141,6 +141,11 @@ class BaseRepo(ABC):
         """GitHub service for this repo (per-repo token if configured)."""
         return self._github_service or self.services.github
 
+    def close(self) -> None:
+        """Close the per-repo GitHub service, if this repo has one."""
+        if self._github_service is not None:
+            self._github_service.close()
+
     @abstractmethod
     async def get_status(self) -> RepoStatus:
         """Get the high-level status of this repository.
@@ -161,11 +166,22 @@ class BaseRepo(ABC):
         Returns:
             Dictionary of operation name to operation info.
         """
-        if self._operations is not None:
-            return self._operations
+        cls = type(self)
+        operations = BaseRepo._operations_cache.get(cls)
+        if operations is not None:
+            return operations
+
+        # Scan class dicts directly along the MRO; the first definition of a
+        # name wins, as with normal attribute lookup
+        members: dict[str, Any] = {}
+        for klass in cls.__mro__:
+            if klass in (object, ABC):
+                continue
+            for name, attr in vars(klass).items():
+                members.setdefault(name, attr)
 
-        self._operations = {}
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
+        operations = {}
+        for name, method in sorted(members.items()):
             # Skip private methods and base methods
             if name.startswith("_"):
                 continue
@@ -208,14 +224,15 @@ class BaseRepo(ABC):
 
                 parameters.append(param_info)
 
-            self._operations[name] = OperationInfo(
+            operations[name] = OperationInfo(
                 name=name,
                 description=description,
                 parameters=parameters,
                 returns=returns,
             )
 
-        return self._operations
+        BaseRepo._operations_cache[cls] = operations
+        return operations
 
     def get_operation_method(
         self, operation_name: str
@@ -0,0 +1,5 @@
+"""Operation mixins shared between repository types."""
+
+from helm_release_mcp.repos.mixins.tag import TagOperationsMixin
+
+__all__ = ["TagOperationsMixin"]
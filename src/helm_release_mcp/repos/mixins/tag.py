@@ -1,4 +1,4 @@
-"""Tag operations for Dify Enterprise repo."""
+"""Tag operations shared by repository types that release from tags."""
 
 from typing import Any, Protocol, cast
 
@@ -9,7 +9,7 @@ class TagRepoProtocol(Protocol):
 
 
 class TagOperationsMixin:
-    """Mixin providing tag operations for DifyEnterpriseRepo."""
+    """Mixin providing tag operations (DifyEnterpriseRepo, DifyEnterpriseFrontendRepo)."""
 
     async def create_tag(
         self,
@@ -24,33 +24,30 @@ class TagOperationsMixin:
         """
         try:
             repo_ref = cast(TagRepoProtocol, self)
-            repo = repo_ref.github.get_repo(repo_ref.github_path)
+            github = repo_ref.github
+            sha, tag_exists = await github.run_in_pool(
+                github.resolve_branch_and_tag, repo_ref.github_path, branch, tag
+            )
 
-            try:
-                branch_ref = repo.get_branch(branch)
-                sha = branch_ref.commit.sha
-            except Exception:
+            if sha is None:
                 return {
                     "success": False,
                     "error": f"Branch not found: {branch}",
                 }
 
-            try:
-                repo.get_git_ref(f"tags/{tag}")
+            if tag_exists:
                 return {
                     "success": False,
                     "error": f"Tag already exists: {tag}",
                 }
-            except Exception:
-                pass
 
-            git_tag = repo.create_git_tag(
-                tag=tag,
+            await github.run_in_pool(
+                github.create_tag,
+                repo_ref.github_path,
+                tag_name=tag,
                 message=f"Release {tag}",
-                object=sha,
-                type="commit",
+                sha=sha,
             )
-            repo.create_git_ref(ref=f"refs/tags/{tag}", sha=git_tag.sha)
 
             return {
                 "success": True,
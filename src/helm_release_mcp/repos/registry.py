@@ -1,25 +1,27 @@
 """Repository registry for managing repository instances."""
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
 
 from helm_release_mcp.core.files import FileService
 from helm_release_mcp.core.git import GitService
 from helm_release_mcp.core.github import GitHubService
 from helm_release_mcp.core.workspace import WorkspaceManager
-from helm_release_mcp.repos.base import BaseRepo, CoreServices, RepoConfig
-
-# Import repo types to register them
-from helm_release_mcp.repos.types.dify import DifyRepo  # noqa: F401
-from helm_release_mcp.repos.types.dify_enterprise import DifyEnterpriseRepo  # noqa: F401
-from helm_release_mcp.repos.types.dify_enterprise_frontend import (  # noqa: F401
-    DifyEnterpriseFrontendRepo,
-)
-from helm_release_mcp.repos.types.dify_helm import DifyHelmRepo  # noqa: F401
+from helm_release_mcp.repos.base import BaseRepo, CoreServices, RepoConfig, RepoStatus
+from helm_release_mcp.repos.types import register_types
 
 logger = logging.getLogger(__name__)
 
+# Validates the whole `repositories` list in one pydantic-core call
+_REPO_CONFIGS_ADAPTER = TypeAdapter(list[RepoConfig])
+
+# Repos whose status is fetched at once; keeps fan-out under GitHub's
+# secondary rate limits
+STATUS_CONCURRENCY = 10
+
 
 class RepoRegistry:
     """Registry for managing repository instances.
@@ -37,6 +39,8 @@ class RepoRegistry:
         self._services = services
         self._repos: dict[str, BaseRepo] = {}
         self._configs: dict[str, RepoConfig] = {}
+        # Repo type -> repos of that type, in load order
+        self._by_type: dict[str, list[BaseRepo]] = {}
 
     @classmethod
     def from_config(
@@ -46,6 +50,8 @@ class RepoRegistry:
         github_token: str,
         workspace_dir: Path,
         github_api_base_url: str = "https://api.github.com",
+        repo_refresh_ttl: float = 0,
+        github_read_cache_ttl: float = 0,
     ) -> "RepoRegistry":
         """Create a registry from a config file.
 
@@ -54,6 +60,8 @@ class RepoRegistry:
             github_token: GitHub personal access token.
             workspace_dir: Directory for local clones.
             github_api_base_url: GitHub API base URL.
+            repo_refresh_ttl: Seconds a freshly updated clone is reused without fetching.
+            github_read_cache_ttl: Seconds GitHub list/latest reads are reused.
 
         Returns:
             Initialized RepoRegistry.
@@ -64,9 +72,13 @@ class RepoRegistry:
         """
         # Initialize core services
         git_service = GitService()
-        github_service = GitHubService(github_token, github_api_base_url)
+        github_service = GitHubService(
+            github_token, github_api_base_url, read_cache_ttl=github_read_cache_ttl
+        )
         file_service = FileService()
-        workspace_manager = WorkspaceManager(workspace_dir, git_service, github_token)
+        workspace_manager = WorkspaceManager(
+            workspace_dir, git_service, github_token, refresh_ttl=repo_refresh_ttl
+        )
 
         services = CoreServices(
             git=git_service,
@@ -101,29 +113,22 @@ class RepoRegistry:
         if not isinstance(repos_data, list):
             raise ValueError("Invalid config: 'repositories' must be a list")
 
-        for repo_data in repos_data:
-            self._load_repo(repo_data)
+        try:
+            configs = _REPO_CONFIGS_ADAPTER.validate_python(repos_data)
+        except ValidationError as e:
+            raise ValueError(f"Invalid repository config: {e}") from e
 
-    def _load_repo(self, repo_data: dict[str, Any]) -> None:
-        """Load a single repository from config data.
+        # Repo type modules are only needed once there is config to load
+        register_types()
+        for config in configs:
+            self._load_repo(config)
+
+    def _load_repo(self, config: RepoConfig) -> None:
+        """Instantiate and register a single repository.
 
         Args:
-            repo_data: Repository configuration dictionary.
+            config: Validated repository configuration.
         """
-        # Validate required fields
-        required = ["name", "github", "type"]
-        for field in required:
-            if field not in repo_data:
-                raise ValueError(f"Repository config missing required field: {field}")
-
-        config = RepoConfig(
-            name=repo_data["name"],
-            github=repo_data["github"],
-            type=repo_data["type"],
-            description=repo_data.get("description", ""),
-            settings=repo_data.get("settings", {}),
-        )
-
         # Get the repo type class
         repo_class = BaseRepo.get_type_class(config.type)
         if repo_class is None:
@@ -135,8 +140,12 @@ class RepoRegistry:
 
         # Instantiate the repo
         repo = repo_class(config, self._services)
+        previous = self._repos.get(config.name)
+        if previous is not None:
+            self._by_type[previous.repo_type].remove(previous)
         self._repos[config.name] = repo
         self._configs[config.name] = config
+        self._by_type.setdefault(repo.repo_type, []).append(repo)
 
         logger.info(f"Loaded repo: {config.name} ({config.type})")
 
@@ -187,7 +196,31 @@ class RepoRegistry:
         Returns:
             List of matching repositories.
         """
-        return [repo for repo in self._repos.values() if repo.repo_type == repo_type]
+        return list(self._by_type.get(repo_type, ()))
+
+    async def get_all_statuses(self) -> dict[str, RepoStatus | Exception]:
+        """Get the status of every repository concurrently.
+
+        Returns:
+            Dictionary of name to status, or to the exception raised while
+            fetching that repository's status.
+        """
+        semaphore = asyncio.Semaphore(STATUS_CONCURRENCY)
+
+        async def fetch(repo: BaseRepo) -> RepoStatus:
+            async with semaphore:
+                return await repo.get_status()
+
+        names = list(self._repos)
+        results = await asyncio.gather(
+            *(fetch(self._repos[name]) for name in names), return_exceptions=True
+        )
+        statuses: dict[str, RepoStatus | Exception] = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            statuses[name] = result
+        return statuses
 
     @property
     def services(self) -> CoreServices:
@@ -196,4 +229,6 @@ class RepoRegistry:
 
     def close(self) -> None:
         """Clean up resources."""
+        for repo in self._repos.values():
+            repo.close()
         self._services.github.close()
@@ -1,15 +1,47 @@
-"""Concrete repository type implementations."""
+"""Concrete repository type implementations.
+
+Type modules are imported on first use: accessing a class attribute here
+imports its module, and register_types() imports all of them so that every
+type is present in the BaseRepo registry.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from helm_release_mcp.repos.types.dify import DifyRepo
+    from helm_release_mcp.repos.types.dify_enterprise import DifyEnterpriseRepo
+    from helm_release_mcp.repos.types.dify_enterprise_frontend import (
+        DifyEnterpriseFrontendRepo,
+    )
+    from helm_release_mcp.repos.types.dify_helm import DifyHelmRepo
+
+# Exported class name -> module that defines (and registers) it
+_TYPE_MODULES = {
+    "DifyRepo": "helm_release_mcp.repos.types.dify",
+    "DifyEnterpriseRepo": "helm_release_mcp.repos.types.dify_enterprise",
+    "DifyEnterpriseFrontendRepo": "helm_release_mcp.repos.types.dify_enterprise_frontend",
+    "DifyHelmRepo": "helm_release_mcp.repos.types.dify_helm",
+}
+
+
+def register_types() -> None:
+    """Import every repository type module, registering its class."""
+    for module in _TYPE_MODULES.values():
+        importlib.import_module(module)
+
+
+def __getattr__(name: str) -> Any:
+    module = _TYPE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
 
-from helm_release_mcp.repos.types.dify import DifyRepo
-from helm_release_mcp.repos.types.dify_enterprise import DifyEnterpriseRepo
-from helm_release_mcp.repos.types.dify_enterprise_frontend import (
-    DifyEnterpriseFrontendRepo,
-)
-from helm_release_mcp.repos.types.dify_helm import DifyHelmRepo
 
 __all__ = [
     "DifyEnterpriseRepo",
     "DifyEnterpriseFrontendRepo",
     "DifyHelmRepo",
     "DifyRepo",
+    "register_types",
 ]
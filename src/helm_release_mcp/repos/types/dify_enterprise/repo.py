@@ -1,7 +1,9 @@
 """Dify Enterprise repository type."""
 
+import asyncio
+
 from helm_release_mcp.repos.base import BaseRepo, CoreServices, RepoConfig, RepoStatus
-from helm_release_mcp.repos.types.dify_enterprise.tag import TagOperationsMixin
+from helm_release_mcp.repos.mixins import TagOperationsMixin
 
 
 class DifyEnterpriseRepo(
@@ -15,9 +17,15 @@ class DifyEnterpriseRepo(
         super().__init__(config, services)
 
     async def get_status(self) -> RepoStatus:
-        latest = self.github.get_latest_release(self.github_path)
-        open_prs = self.github.list_open_prs(self.github_path)
-        running = self.github.list_workflow_runs(self.github_path, status="in_progress", limit=5)
+        github = self.github
+        # Independent API calls; run them side by side off the event loop
+        latest, open_prs, running = await asyncio.gather(
+            github.run_in_pool(github.get_latest_release, self.github_path),
+            github.run_in_pool(github.list_open_prs, self.github_path),
+            github.run_in_pool(
+                github.list_workflow_runs, self.github_path, status="in_progress", limit=5
+            ),
+        )
 
         return RepoStatus(
             name=self.name,
@@ -1,7 +1,12 @@
 """Dify Helm repository type."""
 
+import asyncio
+
 from helm_release_mcp.repos.base import BaseRepo, CoreServices, RepoConfig, RepoStatus
-from helm_release_mcp.repos.types.dify_helm.workflows import WorkflowOperationsMixin
+from helm_release_mcp.repos.types.dify_helm.workflows import (
+    WORKFLOW_SETTINGS,
+    WorkflowOperationsMixin,
+)
 
 
 class DifyHelmRepo(BaseRepo, WorkflowOperationsMixin, repo_type="dify-helm"):
@@ -9,11 +14,21 @@ class DifyHelmRepo(BaseRepo, WorkflowOperationsMixin, repo_type="dify-helm"):
 
     def __init__(self, config: RepoConfig, services: CoreServices) -> None:
         super().__init__(config, services)
+        # Settings are fixed for the life of the instance; resolve them once
+        self._workflow_files: dict[str, str | None] = {
+            setting: self._get_setting(setting) for setting in WORKFLOW_SETTINGS
+        }
 
     async def get_status(self) -> RepoStatus:
-        latest = self.github.get_latest_release(self.github_path)
-        open_prs = self.github.list_open_prs(self.github_path)
-        running = self.github.list_workflow_runs(self.github_path, status="in_progress", limit=5)
+        github = self.github
+        # Independent API calls; run them side by side off the event loop
+        latest, open_prs, running = await asyncio.gather(
+            github.run_in_pool(github.get_latest_release, self.github_path),
+            github.run_in_pool(github.list_open_prs, self.github_path),
+            github.run_in_pool(
+                github.list_workflow_runs, self.github_path, status="in_progress", limit=5
+            ),
+        )
 
         return RepoStatus(
             name=self.name,
@@ -2,18 +2,20 @@
 
 from typing import Any, Protocol, cast
 
+# Settings a repo using the mixin resolves into `_workflow_files`
+WORKFLOW_SETTINGS = (
+    "cve_scan_workflow",
+    "benchmark_workflow",
+    "license_review_workflow",
+    "linear_checklist_workflow",
+    "release_workflow",
+)
+
 
 class WorkflowRepoProtocol(Protocol):
     github: Any
     github_path: str
-
-    def _get_setting(self, key: str, default: Any = None) -> Any: ...
-    async def _trigger_workflow(
-        self,
-        workflow: str,
-        branch: str,
-        name: str,
-    ) -> dict[str, Any]: ...
+    _workflow_files: dict[str, str | None]
 
 
 class WorkflowOperationsMixin:
@@ -24,60 +26,55 @@ class WorkflowOperationsMixin:
         branch: str,
     ) -> dict[str, Any]:
         """Trigger container security scan workflow on a release branch."""
-        repo = cast(WorkflowRepoProtocol, self)
-        workflow = repo._get_setting("cve_scan_workflow")
-        if not workflow:
-            return {"success": False, "error": "cve_scan_workflow not configured"}
-
-        return await repo._trigger_workflow(workflow, branch, "CVE scan")
+        return await self._trigger_configured_workflow("cve_scan_workflow", "CVE scan", branch)
 
     async def trigger_benchmark(
         self,
         branch: str,
     ) -> dict[str, Any]:
         """Trigger benchmark test workflow on a release branch."""
-        repo = cast(WorkflowRepoProtocol, self)
-        workflow = repo._get_setting("benchmark_workflow")
-        if not workflow:
-            return {"success": False, "error": "benchmark_workflow not configured"}
-
-        return await repo._trigger_workflow(workflow, branch, "benchmark test")
+        return await self._trigger_configured_workflow(
+            "benchmark_workflow", "benchmark test", branch
+        )
 
     async def trigger_license_review(
         self,
         branch: str,
     ) -> dict[str, Any]:
         """Trigger dependency license review workflow on a release branch."""
-        repo = cast(WorkflowRepoProtocol, self)
-        workflow = repo._get_setting("license_review_workflow")
-        if not workflow:
-            return {"success": False, "error": "license_review_workflow not configured"}
-
-        return await repo._trigger_workflow(workflow, branch, "license review")
+        return await self._trigger_configured_workflow(
+            "license_review_workflow", "license review", branch
+        )
 
     async def trigger_linear_checklist(
         self,
         branch: str,
     ) -> dict[str, Any]:
         """Trigger Linear release checklist workflow on a release branch."""
-        repo = cast(WorkflowRepoProtocol, self)
-        workflow = repo._get_setting("linear_checklist_workflow")
-        if not workflow:
-            return {"success": False, "error": "linear_checklist_workflow not configured"}
-
-        return await repo._trigger_workflow(workflow, branch, "Linear checklist")
+        return await self._trigger_configured_workflow(
+            "linear_checklist_workflow", "Linear checklist", branch
+        )
 
     async def release(
         self,
         branch: str,
     ) -> dict[str, Any]:
         """Trigger release workflow to publish Helm chart."""
+        return await self._trigger_configured_workflow("release_workflow", "release", branch)
+
+    async def _trigger_configured_workflow(
+        self,
+        setting: str,
+        label: str,
+        branch: str,
+    ) -> dict[str, Any]:
+        """Trigger the workflow named by a setting, if it is configured."""
         repo = cast(WorkflowRepoProtocol, self)
-        workflow = repo._get_setting("release_workflow")
+        workflow = repo._workflow_files.get(setting)
         if not workflow:
-            return {"success": False, "error": "release_workflow not configured"}
+            return {"success": False, "error": f"{setting} not configured"}
 
-        return await repo._trigger_workflow(workflow, branch, "release")
+        return await self._trigger_workflow(workflow, branch, label)
 
     async def _trigger_workflow(
         self,
@@ -88,7 +85,9 @@ class WorkflowOperationsMixin:
         """Helper to trigger a workflow and return standardized result."""
         try:
             repo = cast(WorkflowRepoProtocol, self)
-            run_id = repo.github.trigger_workflow(
+            # Blocks while polling for the run; keep it off the event loop
+            run_id = await repo.github.run_in_pool(
+                repo.github.trigger_workflow,
                 repo.github_path,
                 workflow,
                 ref=branch,
@@ -54,6 +54,8 @@ def create_server() -> FastMCP:
         github_token=settings.github_token,
         workspace_dir=settings.workspace_dir,
         github_api_base_url=settings.github_api_base_url,
+        repo_refresh_ttl=settings.repo_refresh_ttl,
+        github_read_cache_ttl=settings.github_read_cache_ttl,
     )
 
     token_verifier: StaticTokenVerifier | None = None
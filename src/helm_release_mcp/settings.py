@@ -1,5 +1,6 @@
 """Application settings using pydantic-settings."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -64,6 +65,12 @@ class Settings(BaseSettings):
         description="Port for HTTP transports",
     )
 
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="Uvicorn worker processes for HTTP transports (>1 runs MCP stateless)",
+    )
+
     # Timeouts
     workflow_poll_interval: int = Field(
         default=10,
@@ -75,16 +82,23 @@ class Settings(BaseSettings):
         description="Default workflow wait timeout in seconds",
     )
 
+    repo_refresh_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds a freshly updated clone is reused without fetching (0 disables)",
+    )
 
-# Global settings instance - lazy loaded
-_settings: Settings | None = None
+    github_read_cache_ttl: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds GitHub release, open PR and workflow run lists are reused (0 disables)",
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    if not _settings.github_token:
+    """Get the global settings instance (loaded once, then cached)."""
+    settings = Settings()
+    if not settings.github_token:
         raise ValueError("HELM_MCP_GITHUB_TOKEN must be set")
-    return _settings
+    return settings
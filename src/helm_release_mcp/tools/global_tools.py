@@ -61,6 +61,8 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             repo: Repository name.
 
         Returns status including latest release, open PRs, running workflows.
+        Results may be up to HELM_MCP_GITHUB_READ_CACHE_TTL seconds old
+        (default 0: always fresh).
         """
         repo_obj = registry.get_repo(repo)
         if not repo_obj:
@@ -82,6 +84,27 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                 "error": str(e),
             }
 
+    @mcp.tool()
+    async def get_all_repo_statuses() -> dict[str, Any]:
+        """Get high-level status of every managed repository.
+
+        Statuses are fetched concurrently. Repositories whose status could
+        not be fetched are reported with an error instead. Results may be up
+        to HELM_MCP_GITHUB_READ_CACHE_TTL seconds old (default 0: always fresh).
+        """
+        repos_status = []
+        for name, status in (await registry.get_all_statuses()).items():
+            if isinstance(status, Exception):
+                logger.warning(f"Error getting status for {name}: {status}")
+                repos_status.append({"name": name, "success": False, "error": str(status)})
+            else:
+                repos_status.append({"success": True, **asdict(status)})
+
+        return {
+            "repos": repos_status,
+            "count": len(repos_status),
+        }
+
     @mcp.tool()
     async def get_repo_operations(repo: str) -> dict[str, Any]:
         """Get available operations for a repository.
@@ -129,7 +152,10 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             }
 
         try:
-            run_info = registry.services.github.get_workflow_run(repo_obj.github_path, run_id)
+            github = registry.services.github
+            run_info = await github.run_in_pool(
+                github.get_workflow_run, repo_obj.github_path, run_id
+            )
             return {
                 "success": True,
                 "id": run_info.id,
@@ -187,11 +213,12 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             github_path = repo_obj.github_path
             github = registry.services.github
 
-            pr_info = github.get_pr(github_path, resolved_pr_number)
-
-            checks = github.get_pr_checks_status(github_path, resolved_pr_number)
-
-            reviews = github.get_pr_reviews(github_path, resolved_pr_number)
+            # Independent API calls - run them side by side
+            pr_info, checks, reviews = await asyncio.gather(
+                github.run_in_pool(github.get_pr, github_path, resolved_pr_number),
+                github.run_in_pool(github.get_pr_checks_status, github_path, resolved_pr_number),
+                github.run_in_pool(github.get_pr_reviews, github_path, resolved_pr_number),
+            )
 
             review_state = "pending"
             for review in reversed(reviews):
@@ -252,7 +279,9 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             github = registry.services.github
             github_path = repo_obj.github_path
 
-            comparison = github.compare_commits(github_path, commit, branch)
+            comparison = await github.run_in_pool(
+                github.compare_commits, github_path, commit, branch
+            )
 
             handler = PrCommitHandler()
             contains = handler.check_commit_in_branch(
@@ -323,7 +352,7 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             github = registry.services.github
             github_path = repo_obj.github_path
 
-            pr_info = github.get_pr(github_path, resolved_pr_number)
+            pr_info = await github.run_in_pool(github.get_pr, github_path, resolved_pr_number)
 
             if pr_info.merged and pr_info.base_ref == branch:
                 return {
@@ -344,7 +373,9 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                 pr_info.merge_commit_sha if pr_info.merge_commit_sha else pr_info.head_sha
             )
 
-            comparison = github.compare_commits(github_path, commit_to_check, branch)
+            comparison = await github.run_in_pool(
+                github.compare_commits, github_path, commit_to_check, branch
+            )
 
             contains = handler.check_commit_in_branch(
                 {
@@ -409,12 +440,16 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
         github = registry.services.github
         github_path = repo_obj.github_path
 
-        elapsed = 0
+        # Monotonic clock: wall-clock jumps cannot stretch or cut the wait,
+        # and time spent in API calls counts toward the timeout
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + timeout
         last_status = None
 
-        while elapsed < timeout:
+        while loop.time() < deadline:
             try:
-                run_info = github.get_workflow_run(github_path, run_id)
+                run_info = await github.run_in_pool(github.get_workflow_run, github_path, run_id)
                 last_status = run_info.status
 
                 if run_info.status == "completed":
@@ -426,16 +461,12 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                         "status": run_info.status,
                         "conclusion": run_info.conclusion,
                         "html_url": run_info.html_url,
-                        "elapsed_seconds": elapsed,
+                        "elapsed_seconds": round(loop.time() - start),
                     }
-
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
-
             except Exception as e:
                 logger.warning(f"Error polling workflow {run_id}: {e}")
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
+
+            await asyncio.sleep(min(poll_interval, max(deadline - loop.time(), 0)))
 
         return {
             "success": False,
@@ -452,6 +483,7 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
         branch: str | None = None,
         tag: str | None = None,
         status: str | None = None,
+        event: str | None = None,
         limit: int = 10,
     ) -> dict[str, Any]:
         """List recent workflow runs for a repository.
@@ -464,10 +496,12 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             status: Filter by status. Available values: queued, in_progress, completed,
                     action_required, cancelled, failure, neutral, skipped, stale, success,
                     timed_out, waiting, pending, requested.
+            event: Filter by triggering event (e.g., "push", "workflow_dispatch").
             limit: Maximum runs to return (default: 10).
 
         Note:
             Either 'branch' or 'tag' must be provided. If both are provided, 'tag' takes priority.
+            Results may be up to HELM_MCP_GITHUB_READ_CACHE_TTL seconds old (default 0).
         """
         repo_obj = registry.get_repo(repo)
         if not repo_obj:
@@ -482,16 +516,19 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                 "error": "Either 'branch' or 'tag' must be provided",
             }
 
+        github = registry.services.github
         head_sha = None
         if tag:
             try:
-                github_repo = repo_obj.github.get_repo(repo_obj.github_path)
+                github_repo = await github.run_in_pool(github.get_repo, repo_obj.github_path)
                 normalized_tag = tag.replace("refs/tags/", "")
-                tag_ref = github_repo.get_git_ref(f"tags/{normalized_tag}")
+                tag_ref = await github.run_in_pool(
+                    github_repo.get_git_ref, f"tags/{normalized_tag}"
+                )
 
                 # Annotated tags require dereferencing to reach the commit object
                 if tag_ref.object.type == "tag":
-                    git_tag = github_repo.get_git_tag(tag_ref.object.sha)
+                    git_tag = await github.run_in_pool(github_repo.get_git_tag, tag_ref.object.sha)
                     head_sha = git_tag.object.sha
                 else:
                     head_sha = tag_ref.object.sha
@@ -505,12 +542,14 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                 }
 
         try:
-            runs = registry.services.github.list_workflow_runs(
+            runs = await github.run_in_pool(
+                github.list_workflow_runs,
                 repo_obj.github_path,
                 workflow_file=workflow_file,
                 branch=branch,
                 status=status,
                 head_sha=head_sha,
+                event=event,
                 limit=limit,
             )
 
@@ -542,6 +581,9 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
     async def list_open_prs(repo: str, base: str | None = None) -> dict[str, Any]:
         """List open pull requests for a repository.
 
+        Results may be up to HELM_MCP_GITHUB_READ_CACHE_TTL seconds old
+        (default 0: always fresh).
+
         Args:
             repo: Repository name.
             base: Filter by base branch.
@@ -554,7 +596,8 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             }
 
         try:
-            prs = registry.services.github.list_open_prs(repo_obj.github_path, base=base)
+            github = registry.services.github
+            prs = await github.run_in_pool(github.list_open_prs, repo_obj.github_path, base=base)
 
             return {
                 "success": True,
@@ -597,33 +640,15 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             }
 
         try:
-            github_repo = repo_obj.github.get_repo(repo_obj.github_path)
+            github = repo_obj.github
+            github_repo = await github.run_in_pool(github.get_repo, repo_obj.github_path)
 
             if base_ref is None:
-                base_ref = repo_obj.github.get_default_branch(repo_obj.github_path)
-
-            base_sha = None
-
-            try:
-                ref = github_repo.get_git_ref(f"tags/{base_ref}")
-                base_sha = ref.object.sha
-            except Exception:
-                pass
-
-            if not base_sha:
-                try:
-                    branch_ref = github_repo.get_branch(base_ref)
-                    base_sha = branch_ref.commit.sha
-                except Exception:
-                    pass
-
-            if not base_sha:
-                try:
-                    commit = github_repo.get_commit(base_ref)
-                    base_sha = commit.sha
-                except Exception:
-                    pass
+                base_ref = await github.run_in_pool(github.get_default_branch, repo_obj.github_path)
 
+            base_sha = await github.run_in_pool(
+                github.resolve_commit_sha, repo_obj.github_path, base_ref
+            )
             if not base_sha:
                 return {
                     "success": False,
@@ -631,7 +656,7 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                 }
 
             try:
-                github_repo.get_branch(branch)
+                await github.run_in_pool(github_repo.get_git_ref, f"heads/{branch}")
                 return {
                     "success": False,
                     "error": f"Branch already exists: {branch}",
@@ -639,7 +664,11 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
             except Exception:
                 pass
 
-            github_repo.create_git_ref(ref=f"refs/heads/{branch}", sha=base_sha)
+            await github.run_in_pool(
+                github_repo.create_git_ref, ref=f"refs/heads/{branch}", sha=base_sha
+            )
+            # Created on the raw PyGithub object, so drop cached reads by hand
+            github.invalidate(repo_obj.github_path)
 
             return {
                 "success": True,
@@ -660,6 +689,9 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
     async def get_release_branch_info(repo: str, branch: str) -> dict[str, Any]:
         """Get release branch info including latest commit and workflow runs.
 
+        Workflow runs may be up to HELM_MCP_GITHUB_READ_CACHE_TTL seconds old
+        (default 0: always fresh).
+
         Args:
             repo: Repository name.
             branch: Branch name to check.
@@ -673,7 +705,7 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
 
         try:
             github = repo_obj.github
-            branch_info = github.get_branch(repo_obj.github_path, branch)
+            branch_info = await github.run_in_pool(github.get_branch, repo_obj.github_path, branch)
 
             if branch_info is None:
                 return {
@@ -682,7 +714,8 @@ def register_global_tools(mcp: FastMCP, registry: RepoRegistry) -> None:
                     "error": f"Branch not found: {branch}",
                 }
 
-            workflow_runs = github.list_workflow_runs(
+            workflow_runs = await github.run_in_pool(
+                github.list_workflow_runs,
                 repo_obj.github_path,
                 branch=branch,
                 limit=5,